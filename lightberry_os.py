@@ -150,19 +150,23 @@ class LightBerryOS:
         """Start background threads for notifications and updates"""
         def notification_thread():
             while self.running:
-                try:
-                    # Check for calendar notifications
-                    if "Calendar" in self.modules:
-                        self.modules["Calendar"].check_notifications()
-                    
-                    # Update weather data
-                    if "Weather" in self.modules:
-                        self.modules["Weather"].update_weather_data()
-                    
-                    time.sleep(60)  # Check every minute
-                except Exception as e:
-                    print(f"Background thread error: {e}")
-                    time.sleep(60)
+                # Check for calendar notifications
+                calendar = self.modules.get("Calendar")
+                if hasattr(calendar, 'check_notifications'):
+                    try:
+                        calendar.check_notifications()
+                    except Exception as e:
+                        print(f"Background thread error (calendar): {e}")
+                
+                # Update weather data
+                weather = self.modules.get("Weather")
+                if hasattr(weather, 'update_weather_data'):
+                    try:
+                        weather.update_weather_data()
+                    except Exception as e:
+                        print(f"Background thread error (weather): {e}")
+                
+                time.sleep(60)  # Check every minute
         
         thread = threading.Thread(target=notification_thread, daemon=True)
         thread.start()
@@ -408,6 +412,8 @@ class LightBerryOS:
             print("\nShutting down LightBerry OS...")
         finally:
             self.save_data()
+            self.data_manager.flush()
+            self.hardware_manager.close()
             pygame.quit()
             sys.exit()
 
@@ -4,14 +4,23 @@ Enhanced Weather Module with Beautiful Animations for LightBerry OS
 """
 
 import pygame
-import subprocess
-import json
-import os
 import math
 import random
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime
 from config.constants import *
 
+# (stored key, Weather attribute) pairs kept in each weather_data entry
+WEATHER_FIELDS = (
+    ("condition", "current_condition"),
+    ("temperature", "current_temp"),
+    ("feels_like", "feels_like"),
+    ("humidity", "humidity"),
+    ("wind_speed", "wind_speed"),
+    ("uv_index", "uv_index"),
+)
+
 class Weather:
     def __init__(self, os_instance):
         self.os = os_instance
@@ -24,6 +33,8 @@ class Weather:
         self.mode = "view"
         self.last_update = datetime.now()
         self.update_interval = 1800  # 30 minutes
+        self.next_update = time.monotonic() + self.update_interval
+        self.weather_lock = threading.Lock()  # weather_data is written from the background thread
         
         # Animation system
         self.animation_time = 0
@@ -39,14 +50,28 @@ class Weather:
         self.wind_speed = 12
         self.uv_index = 7
         
+        # Rendered weather info, rebuilt when info_key changes
+        self.info_surfaces = []
+        self.info_key = None
+        self.controls_surface = None
+        
+        # Cached full frame for scenes with no animation
+        self.frame_surface = None
+        self.frame_key = None
+        
+        # Pre-rendered gradient background, rebuilt when the condition changes
+        self.background_surface = None
+        self.background_condition = None
+        
         # Load proper fonts for emoji support
         self.load_fonts()
         
         # Initialize particles based on weather
+        self.init_particle_sprites()
         self.init_particles()
         
         # Simple weather icons that work on all systems
-        self.weather_icons = {
+        weather_icons = {
             "clear": "☀", "sunny": "☀", "partly_cloudy": "⛅", "cloudy": "☁",
             "overcast": "☁", "rain": "🌧", "drizzle": "🌦", "showers": "🌦", 
             "thunderstorm": "⛈", "storm": "⛈", "snow": "🌨", "sleet": "🌨",
@@ -55,7 +80,7 @@ class Weather:
         }
         
         # Enhanced color gradients for each weather condition
-        self.weather_gradients = {
+        weather_gradients = {
             "sunny": [(255, 215, 0), (255, 165, 0), (255, 140, 0)],
             "clear": [(135, 206, 250), (173, 216, 230), (240, 248, 255)],
             "partly_cloudy": [(169, 169, 169), (192, 192, 192), (220, 220, 220)],
@@ -66,6 +91,17 @@ class Weather:
             "fog": [(128, 128, 128), (169, 169, 169), (192, 192, 192)],
             "night": [(25, 25, 112), (72, 61, 139), (123, 104, 238)]
         }
+        
+        # Single lookup of condition -> (icon, gradient); unknown conditions
+        # fall back to the default icon and the clear-sky gradient
+        self.condition_meta = {
+            condition: (weather_icons.get(condition, weather_icons["default"]),
+                        weather_gradients.get(condition, weather_gradients["clear"]))
+            for condition in {**weather_icons, **weather_gradients}
+        }
+        
+        # Pre-render every icon once
+        self.init_icon_surfaces()
     
     def load_fonts(self):
         """Load fonts with emoji support"""
@@ -86,30 +122,56 @@ class Weather:
         except:
             print("✗ Emoji font loading failed, using fallback")
     
+    def init_icon_surfaces(self):
+        """Render each condition icon once, with a text fallback"""
+        self.icon_surfaces = {}
+        for condition, (icon, gradient) in self.condition_meta.items():
+            try:
+                icon_surface = self.emoji_font.render(icon, True, (255, 255, 255))
+            except:
+                # Fallback to text representation
+                icon_surface = self.os.font_xl.render(condition.upper(), True, (255, 255, 255))
+            self.icon_surfaces[condition] = icon_surface
+    
+    def init_particle_sprites(self):
+        """Pre-render one sprite per rain length and snow size"""
+        self.rain_sprites = {}
+        for length in range(8, 16):
+            sprite = pygame.Surface((2, length + 1), pygame.SRCALPHA)
+            sprite.fill((173, 216, 230))  # Light blue
+            self.rain_sprites[length] = sprite
+        
+        self.snow_sprites = {}
+        for size in range(2, 5):
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (255, 255, 255), (size, size), size)
+            self.snow_sprites[size] = sprite
+    
     def init_particles(self):
         """Initialize particles based on current weather"""
         self.particles = []
+        # Rain and snow are bucketed by length/size so each bucket shares a sprite
+        self.rain_buckets = {}
+        self.snow_buckets = {}
         
         if self.current_condition in ["rain", "drizzle", "showers"]:
             # Rain particles
             for _ in range(80):
-                self.particles.append({
-                    'type': 'rain',
+                length = random.randint(8, 15)
+                self.rain_buckets.setdefault(length, []).append({
                     'x': random.randint(0, SCREEN_WIDTH),
                     'y': random.randint(-SCREEN_HEIGHT, 0),
-                    'speed': random.uniform(3, 7),
-                    'length': random.randint(8, 15)
+                    'speed': random.uniform(3, 7)
                 })
         
         elif self.current_condition in ["snow", "sleet"]:
             # Snow particles
             for _ in range(60):
-                self.particles.append({
-                    'type': 'snow',
+                size = random.randint(2, 4)
+                self.snow_buckets.setdefault(size, []).append({
                     'x': random.randint(0, SCREEN_WIDTH),
                     'y': random.randint(-SCREEN_HEIGHT, 0),
                     'speed': random.uniform(1, 3),
-                    'size': random.randint(2, 4),
                     'drift': random.uniform(-0.5, 0.5)
                 })
         
@@ -131,14 +193,15 @@ class Weather:
     
     def update_particles(self):
         """Update particle animations"""
-        for particle in self.particles:
-            if particle['type'] == 'rain':
+        for bucket in self.rain_buckets.values():
+            for particle in bucket:
                 particle['y'] += particle['speed']
                 if particle['y'] > SCREEN_HEIGHT:
                     particle['y'] = random.randint(-50, 0)
                     particle['x'] = random.randint(0, SCREEN_WIDTH)
-            
-            elif particle['type'] == 'snow':
+        
+        for bucket in self.snow_buckets.values():
+            for particle in bucket:
                 particle['y'] += particle['speed']
                 particle['x'] += particle['drift']
                 if particle['y'] > SCREEN_HEIGHT:
@@ -146,8 +209,9 @@ class Weather:
                     particle['x'] = random.randint(0, SCREEN_WIDTH)
                 if particle['x'] < 0 or particle['x'] > SCREEN_WIDTH:
                     particle['x'] = random.randint(0, SCREEN_WIDTH)
-            
-            elif particle['type'] == 'star':
+        
+        for particle in self.particles:
+            if particle['type'] == 'star':
                 particle['brightness'] += particle['twinkle_speed']
                 if particle['brightness'] > 1.0 or particle['brightness'] < 0.3:
                     particle['twinkle_speed'] *= -1
@@ -164,9 +228,33 @@ class Weather:
             if self.lightning_flash > 0:
                 self.lightning_flash -= 1
     
+    def update_weather_data(self):
+        """Refresh stored weather data (called from the OS background thread, never the UI loop)"""
+        if time.monotonic() < self.next_update:
+            return
+        
+        now = datetime.now()
+        weather_info = {key: getattr(self, attr) for key, attr in WEATHER_FIELDS}
+        weather_info["last_updated"] = now.isoformat()
+        
+        with self.weather_lock:
+            self.weather_data[self.location] = weather_info
+            self.last_update = now
+        self.next_update = time.monotonic() + self.update_interval
+    
     def draw_gradient_background(self, screen, condition):
         """Draw beautiful gradient background"""
-        colors = self.weather_gradients.get(condition, self.weather_gradients["clear"])
+        # The gradient only depends on the condition, so render it once per change
+        if condition != self.background_condition:
+            self.background_surface = self.render_gradient_background(condition)
+            self.background_condition = condition
+        
+        screen.blit(self.background_surface, (0, 0))
+    
+    def render_gradient_background(self, condition):
+        """Render the gradient background for a condition into a surface"""
+        colors = self.condition_meta.get(condition, self.condition_meta["default"])[1]
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
         
         # Create gradient effect
         for y in range(SCREEN_HEIGHT):
@@ -184,32 +272,30 @@ class Weather:
                 g = int(colors[1][1] * (1 - blend_ratio) + colors[2][1] * blend_ratio)
                 b = int(colors[1][2] * (1 - blend_ratio) + colors[2][2] * blend_ratio)
             
-            pygame.draw.line(screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+            pygame.draw.line(surface, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        
+        return surface
     
     def draw_particles(self, screen):
         """Draw weather particles"""
+        for length, bucket in self.rain_buckets.items():
+            sprite = self.rain_sprites[length]
+            screen.blits([(sprite, (int(p['x']), int(p['y']))) for p in bucket], False)
+        
+        for size, bucket in self.snow_buckets.items():
+            sprite = self.snow_sprites[size]
+            screen.blits([(sprite, (int(p['x']) - size, int(p['y']) - size)) for p in bucket], False)
+        
         for particle in self.particles:
-            if particle['type'] == 'rain':
-                color = (173, 216, 230)  # Light blue
-                start_pos = (int(particle['x']), int(particle['y']))
-                end_pos = (int(particle['x']), int(particle['y'] + particle['length']))
-                pygame.draw.line(screen, color, start_pos, end_pos, 2)
-            
-            elif particle['type'] == 'snow':
-                color = (255, 255, 255)
-                pygame.draw.circle(screen, color, 
-                                 (int(particle['x']), int(particle['y'])), 
-                                 particle['size'])
-            
-            elif particle['type'] == 'star':
+            if particle['type'] == 'star':
                 brightness = int(255 * particle['brightness'])
                 color = (brightness, brightness, brightness)
                 pygame.draw.circle(screen, color, 
                                  (int(particle['x']), int(particle['y'])), 2)
     
-    def draw_sun(self, screen):
+    def draw_sun(self, screen, night):
         """Draw animated sun"""
-        if self.current_condition in ["sunny", "clear"] and not self.is_night():
+        if self.current_condition in ["sunny", "clear"] and not night:
             sun_x = SCREEN_WIDTH - 80
             sun_y = 60
             
@@ -226,9 +312,9 @@ class Weather:
             pygame.draw.circle(screen, (255, 215, 0), (sun_x, sun_y), 25)
             pygame.draw.circle(screen, (255, 255, 0), (sun_x, sun_y), 20)
     
-    def draw_moon(self, screen):
+    def draw_moon(self, screen, night):
         """Draw moon for night time"""
-        if self.is_night() and self.current_condition in ["clear", "partly_cloudy"]:
+        if night and self.current_condition in ["clear", "partly_cloudy"]:
             moon_x = SCREEN_WIDTH - 80
             moon_y = 60
             
@@ -258,40 +344,46 @@ class Weather:
                 ]
                 pygame.draw.lines(screen, (255, 255, 100), False, points, 4)
     
-    def draw_weather_info(self, screen):
+    def draw_weather_info(self, screen, night):
         """Draw main weather information"""
+        # Text only changes with the condition (or day/night), so reuse the rendered surfaces
+        info_key = (self.current_condition, night)
+        if info_key != self.info_key:
+            self.info_surfaces = self.render_weather_info(info_key[1])
+            self.info_key = info_key
+        
+        for surface, position in self.info_surfaces:
+            screen.blit(surface, position)
+    
+    def render_weather_info(self, night):
+        """Render weather information into a list of (surface, position) pairs"""
+        surfaces = []
+        
         # Location
         location_surface = self.os.font_xl.render(self.location, True, (255, 255, 255))
         location_x = SCREEN_WIDTH // 2 - location_surface.get_width() // 2
-        screen.blit(location_surface, (location_x, 20))
+        surfaces.append((location_surface, (location_x, 20)))
         
         # Weather icon and condition
         condition = self.current_condition
-        if self.is_night() and condition in ["clear", "partly_cloudy"]:
+        if night and condition in ["clear", "partly_cloudy"]:
             condition = f"night_{condition}"
         
-        # Try to render emoji icon with fallback
-        icon = self.weather_icons.get(condition, self.weather_icons["default"])
-        try:
-            icon_surface = self.emoji_font.render(icon, True, (255, 255, 255))
-        except:
-            # Fallback to text representation
-            icon_surface = self.os.font_xl.render(condition.upper(), True, (255, 255, 255))
-        
+        icon_surface = self.icon_surfaces.get(condition, self.icon_surfaces["default"])
         icon_x = SCREEN_WIDTH // 2 - icon_surface.get_width() // 2
-        screen.blit(icon_surface, (icon_x, 60))
+        surfaces.append((icon_surface, (icon_x, 60)))
         
         # Temperature
         temp_text = f"{self.current_temp}°"
         temp_surface = self.os.font_xl.render(temp_text, True, (255, 255, 255))
         temp_x = SCREEN_WIDTH // 2 - temp_surface.get_width() // 2
-        screen.blit(temp_surface, (temp_x, 110))
+        surfaces.append((temp_surface, (temp_x, 110)))
         
         # Condition description
         desc_text = condition.replace("_", " ").title()
         desc_surface = self.os.font_l.render(desc_text, True, (220, 220, 220))
         desc_x = SCREEN_WIDTH // 2 - desc_surface.get_width() // 2
-        screen.blit(desc_surface, (desc_x, 160))
+        surfaces.append((desc_surface, (desc_x, 160)))
         
         # Additional info
         info_y = 190
@@ -306,7 +398,9 @@ class Weather:
             info_surface = self.os.font_s.render(info, True, (200, 200, 200))
             info_x = 20 + (i % 2) * 180
             info_y_pos = info_y + (i // 2) * 20
-            screen.blit(info_surface, (info_x, info_y_pos))
+            surfaces.append((info_surface, (info_x, info_y_pos)))
+        
+        return surfaces
     
     def handle_events(self, event):
         """Handle weather events"""
@@ -315,37 +409,61 @@ class Weather:
                 return "back"
             elif event.key == pygame.K_r:
                 # Test rain
-                self.current_condition = "rain"
-                self.init_particles()
-                print("✓ Switched to rain mode")
+                self.set_condition("rain")
             elif event.key == pygame.K_s:
                 # Test snow
-                self.current_condition = "snow"
-                self.init_particles()
-                print("✓ Switched to snow mode")
+                self.set_condition("snow")
             elif event.key == pygame.K_t:
                 # Test thunderstorm
-                self.current_condition = "thunderstorm"
-                self.init_particles()
-                print("✓ Switched to thunderstorm mode")
+                self.set_condition("thunderstorm")
             elif event.key == pygame.K_c:
                 # Test clear
-                self.current_condition = "clear"
-                self.init_particles()
-                print("✓ Switched to clear mode")
+                self.set_condition("clear")
         
         return None
     
+    def set_condition(self, condition):
+        """Switch to a test condition, skipping work if it is already active"""
+        if condition == self.current_condition:
+            return
+        
+        self.current_condition = condition
+        self.init_particles()
+        print(f"✓ Switched to {condition} mode")
+    
     def update(self):
         """Update weather animations"""
         self.animation_time += 1
         self.update_particles()
         self.update_lightning()
     
+    def is_animated(self, night):
+        """Check if anything on screen moves from frame to frame"""
+        return bool(self.rain_buckets or self.snow_buckets or self.particles
+                    or self.lightning_flash > 0
+                    or (self.current_condition in ["sunny", "clear"] and not night))
+    
     def draw(self, screen):
         """Draw weather interface with animations"""
+        # Check the clock once per frame
+        night = self.is_night()
+        
+        # Static scenes are composed once and then blitted as a single frame
+        if not self.is_animated(night):
+            frame_key = (self.current_condition, night)
+            if frame_key != self.frame_key:
+                self.frame_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+                self.draw_scene(self.frame_surface, night)
+                self.frame_key = frame_key
+            screen.blit(self.frame_surface, (0, 0))
+            return
+        
+        self.draw_scene(screen, night)
+    
+    def draw_scene(self, screen, night):
+        """Draw all weather layers"""
         # Draw gradient background
-        condition = "night" if self.is_night() else self.current_condition
+        condition = "night" if night else self.current_condition
         self.draw_gradient_background(screen, condition)
         
         # Draw lightning effect
@@ -355,25 +473,45 @@ class Weather:
         self.draw_particles(screen)
         
         # Draw sun or moon
-        self.draw_sun(screen)
-        self.draw_moon(screen)
+        self.draw_sun(screen, night)
+        self.draw_moon(screen, night)
         
         # Draw weather information
-        self.draw_weather_info(screen)
+        self.draw_weather_info(screen, night)
         
-        # Controls hint
-        controls_text = "R:Rain S:Snow T:Thunder C:Clear ESC:Back"
-        controls_surface = self.os.font_tiny.render(controls_text, True, (150, 150, 150))
-        screen.blit(controls_surface, (10, SCREEN_HEIGHT - 15))
+        # Controls hint (static text, rendered on first draw)
+        if self.controls_surface is None:
+            controls_text = "R:Rain S:Snow T:Thunder C:Clear ESC:Back"
+            self.controls_surface = self.os.font_tiny.render(controls_text, True, (150, 150, 150))
+        screen.blit(self.controls_surface, (10, SCREEN_HEIGHT - 15))
     
     def save_data(self):
         """Save weather data"""
+        with self.weather_lock:
+            weather_data = dict(self.weather_data)
+        
         return {
             "location": self.location,
-            "weather_data": self.weather_data
+            "weather_data": weather_data
         }
     
     def load_data(self, data):
         """Load weather data"""
         self.location = data.get("location", "Madrid")
-        self.weather_data = data.get("weather_data", {})
+        with self.weather_lock:
+            self.weather_data = data.get("weather_data", {})
+            weather = self.weather_data.get(self.location)
+        
+        # Serve the saved snapshot until it goes stale instead of refreshing at boot
+        if weather:
+            try:
+                self.last_update = datetime.fromisoformat(weather["last_updated"])
+                age = (datetime.now() - self.last_update).total_seconds()
+                self.next_update = time.monotonic() + self.update_interval - age
+                for key, attr in WEATHER_FIELDS:
+                    setattr(self, attr, weather.get(key, getattr(self, attr)))
+                self.init_particles()
+                self.info_key = None
+                self.frame_key = None
+            except (KeyError, TypeError, ValueError) as e:
+                print(f"Ignoring stale weather data: {e}")
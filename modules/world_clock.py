@@ -5,10 +5,19 @@ Professional world clock with capital cities and timezone management
 
 import pygame
 import math
-from datetime import datetime, timedelta
+import time
 from config.constants import *
 from config.world_cities import WORLD_CAPITALS
 
+# (casefolded name, name) for every capital, built once for searching
+CAPITALS_INDEX = [(city.casefold(), city) for city in sorted(WORLD_CAPITALS)]
+
+DEFAULT_CLOCKS = [
+    {"name": "Madrid", "timezone": 1, "color": TIME_ZONE_COLORS[0]},
+    {"name": "New York", "timezone": -5, "color": TIME_ZONE_COLORS[1]},
+    {"name": "Tokyo", "timezone": 9, "color": TIME_ZONE_COLORS[2]},
+]
+
 class WorldClock:
     def __init__(self, os_instance):
         self.os = os_instance
@@ -16,11 +25,8 @@ class WorldClock:
     
     def init_world_clock(self):
         """Initialize world clock state"""
-        self.world_clocks = [
-            {"name": "Madrid", "timezone": 1, "color": TIME_ZONE_COLORS[0]},
-            {"name": "New York", "timezone": -5, "color": TIME_ZONE_COLORS[1]},
-            {"name": "Tokyo", "timezone": 9, "color": TIME_ZONE_COLORS[2]},
-        ]
+        # Clocks are stored as parallel lists (name, UTC offset, color)
+        self.set_clocks(DEFAULT_CLOCKS)
         
         self.mode = "view"
         self.selected_clock = 0
@@ -29,13 +35,25 @@ class WorldClock:
         self.search_selected = 0
         self.max_clocks = 3
         
-        # Animation
-        self.animation_offset = 0
-        self.animation_time = 0
+        # Last search query and all of its index matches (not capped to 10)
+        self.search_query = ""
+        self.search_matches = []
+        
+        # Epoch time sampled once per frame in update()
+        self.utc_now = None
+        self.utc_second = None
+        
+        # (UTC second, timezone, format) -> formatted time string
+        self.time_strings = {}
+        
+        # Clock radius -> hour-marker endpoint offsets
+        self.marker_offsets = {}
         
-        # Text input
-        self.text_cursor_visible = True
-        self.text_cursor_timer = 0
+        # (font, text, color) -> (rendered surface, width)
+        self.text_cache = {}
+        
+        # (radius, hour, minute, second, color) -> rendered clock face
+        self.clock_faces = {}
     
     def handle_events(self, event):
         """Handle world clock events"""
@@ -62,26 +80,24 @@ class WorldClock:
             self.selected_clock = max(0, self.selected_clock - 1)
         
         elif event.key == pygame.K_DOWN:
-            self.selected_clock = min(len(self.world_clocks) - 1, self.selected_clock + 1)
+            self.selected_clock = min(len(self.clock_names) - 1, self.selected_clock + 1)
         
         elif event.key == pygame.K_a:
-            if len(self.world_clocks) < self.max_clocks:
+            if len(self.clock_names) < self.max_clocks:
                 self.mode = "add"
                 self.input_text = ""
                 self.search_results = []
                 self.search_selected = 0
         
         elif event.key == pygame.K_d:
-            if self.world_clocks and len(self.world_clocks) > 1:
-                del self.world_clocks[self.selected_clock]
-                self.selected_clock = min(self.selected_clock, len(self.world_clocks) - 1)
+            if len(self.clock_names) > 1:
+                del self.clock_names[self.selected_clock]
+                del self.clock_timezones[self.selected_clock]
+                del self.clock_colors[self.selected_clock]
+                self.selected_clock = min(self.selected_clock, len(self.clock_names) - 1)
         
         elif event.key == pygame.K_r:
-            self.world_clocks = [
-                {"name": "Madrid", "timezone": 1, "color": TIME_ZONE_COLORS[0]},
-                {"name": "New York", "timezone": -5, "color": TIME_ZONE_COLORS[1]},
-                {"name": "Tokyo", "timezone": 9, "color": TIME_ZONE_COLORS[2]},
-            ]
+            self.set_clocks(DEFAULT_CLOCKS)
             self.selected_clock = 0
     
     def handle_add_events(self, event):
@@ -115,80 +131,117 @@ class WorldClock:
             self.search_results = []
             return
         
-        search_term = self.input_text.lower()
-        self.search_results = []
+        search_term = self.input_text.casefold()
+        
+        # Typing another character can only narrow the previous matches
+        if self.search_query and search_term.startswith(self.search_query):
+            candidates = self.search_matches
+        else:
+            candidates = CAPITALS_INDEX
+        
+        self.search_matches = [(city_key, city) for city_key, city in candidates if search_term in city_key]
+        self.search_query = search_term
         
-        for city, info in WORLD_CAPITALS.items():
-            if search_term in city.lower():
-                # Check if already added
-                already_added = any(clock["name"] == city for clock in self.world_clocks)
-                if not already_added:
-                    self.search_results.append(city)
+        added_cities = set(self.clock_names)
+        self.search_results = [city for city_key, city in self.search_matches if city not in added_cities]
         
-        self.search_results = sorted(self.search_results)[:10]  # Limit to 10 results
+        # CAPITALS_INDEX is already in name order, so no sort is needed
+        self.search_results = self.search_results[:10]  # Limit to 10 results
         self.search_selected = 0
     
+    def set_clocks(self, clocks):
+        """Replace all clocks from a list of clock dicts"""
+        self.clock_names = [clock["name"] for clock in clocks]
+        self.clock_timezones = [clock["timezone"] for clock in clocks]
+        self.clock_colors = [tuple(clock["color"]) for clock in clocks]
+    
+    def get_clocks(self):
+        """Get all clocks as a list of clock dicts"""
+        return [
+            {"name": name, "timezone": timezone, "color": color}
+            for name, timezone, color in zip(self.clock_names, self.clock_timezones, self.clock_colors)
+        ]
+    
     def add_clock(self, city_name):
         """Add a new clock"""
-        if len(self.world_clocks) >= self.max_clocks:
+        if len(self.clock_names) >= self.max_clocks:
             return
         
         if city_name in WORLD_CAPITALS:
             city_info = WORLD_CAPITALS[city_name]
-            color_index = len(self.world_clocks) % len(TIME_ZONE_COLORS)
-            
-            new_clock = {
-                "name": city_name,
-                "timezone": city_info["timezone"],
-                "color": TIME_ZONE_COLORS[color_index]
-            }
+            color_index = len(self.clock_names) % len(TIME_ZONE_COLORS)
             
-            self.world_clocks.append(new_clock)
+            self.clock_names.append(city_name)
+            self.clock_timezones.append(city_info["timezone"])
+            self.clock_colors.append(TIME_ZONE_COLORS[color_index])
     
     def get_time_for_timezone(self, timezone_offset):
-        """Get current time for timezone"""
-        utc_time = datetime.utcnow()
-        local_time = utc_time + timedelta(hours=timezone_offset)
+        """Get current time for timezone as a struct_time"""
+        utc_time = self.utc_now if self.utc_now is not None else time.time()
+        local_time = time.gmtime(utc_time + timezone_offset * 3600)
         return local_time
     
+    def get_marker_offsets(self, radius):
+        """Get hour-marker endpoint offsets for a clock radius, computed once per radius"""
+        offsets = self.marker_offsets.get(radius)
+        if offsets is None:
+            offsets = []
+            for i in range(12):
+                angle = i * 30 - 90  # -90 to start at 12 o'clock
+                angle_rad = math.radians(angle)
+                
+                # Outer and inner point
+                offsets.append((
+                    (radius - 10) * math.cos(angle_rad),
+                    (radius - 10) * math.sin(angle_rad),
+                    (radius - 20) * math.cos(angle_rad),
+                    (radius - 20) * math.sin(angle_rad)
+                ))
+            self.marker_offsets[radius] = offsets
+        
+        return offsets
+    
     def draw_analog_clock(self, screen, x, y, radius, time_obj, color):
-        """Draw analog clock"""
+        """Draw analog clock, re-rendering the face only when the second changes"""
+        key = (radius, time_obj.tm_hour % 12, time_obj.tm_min, time_obj.tm_sec, color)
+        surface = self.clock_faces.get(key)
+        if surface is None:
+            # Each second adds new faces, so start over once the cache grows
+            if len(self.clock_faces) >= 16:
+                self.clock_faces.clear()
+            surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            self.render_analog_clock(surface, radius, radius, radius, time_obj, color)
+            self.clock_faces[key] = surface
+        
+        screen.blit(surface, (x - radius, y - radius))
+    
+    def render_analog_clock(self, screen, x, y, radius, time_obj, color):
+        """Render analog clock centered at (x, y)"""
         # Clock face
         pygame.draw.circle(screen, CLOCK_FACE_COLOR, (x, y), radius)
         pygame.draw.circle(screen, color, (x, y), radius, 3)
         
         # Hour markers
-        for i in range(12):
-            angle = i * 30 - 90  # -90 to start at 12 o'clock
-            angle_rad = math.radians(angle)
-            
-            # Outer point
-            outer_x = x + (radius - 10) * math.cos(angle_rad)
-            outer_y = y + (radius - 10) * math.sin(angle_rad)
-            
-            # Inner point
-            inner_x = x + (radius - 20) * math.cos(angle_rad)
-            inner_y = y + (radius - 20) * math.sin(angle_rad)
-            
+        for outer_dx, outer_dy, inner_dx, inner_dy in self.get_marker_offsets(radius):
             pygame.draw.line(screen, CLOCK_BORDER_COLOR, 
-                           (outer_x, outer_y), (inner_x, inner_y), 2)
+                           (x + outer_dx, y + outer_dy), (x + inner_dx, y + inner_dy), 2)
         
         # Hour hand
-        hour_angle = (time_obj.hour % 12) * 30 + time_obj.minute * 0.5 - 90
+        hour_angle = (time_obj.tm_hour % 12) * 30 + time_obj.tm_min * 0.5 - 90
         hour_angle_rad = math.radians(hour_angle)
         hour_x = x + (radius - 35) * math.cos(hour_angle_rad)
         hour_y = y + (radius - 35) * math.sin(hour_angle_rad)
         pygame.draw.line(screen, CLOCK_HOUR_HAND_COLOR, (x, y), (hour_x, hour_y), 4)
         
         # Minute hand
-        minute_angle = time_obj.minute * 6 - 90
+        minute_angle = time_obj.tm_min * 6 - 90
         minute_angle_rad = math.radians(minute_angle)
         minute_x = x + (radius - 25) * math.cos(minute_angle_rad)
         minute_y = y + (radius - 25) * math.sin(minute_angle_rad)
         pygame.draw.line(screen, CLOCK_MINUTE_HAND_COLOR, (x, y), (minute_x, minute_y), 3)
         
         # Second hand
-        second_angle = time_obj.second * 6 - 90
+        second_angle = time_obj.tm_sec * 6 - 90
         second_angle_rad = math.radians(second_angle)
         second_x = x + (radius - 15) * math.cos(second_angle_rad)
         second_y = y + (radius - 15) * math.sin(second_angle_rad)
@@ -197,16 +250,36 @@ class WorldClock:
         # Center dot
         pygame.draw.circle(screen, TEXT_COLOR, (x, y), 3)
     
+    def format_time(self, time_obj, timezone_offset, fmt):
+        """Format a clock time, running strftime at most once per second per clock"""
+        if self.utc_second is None:
+            return time.strftime(fmt, time_obj)
+        
+        key = (self.utc_second, timezone_offset, fmt)
+        text = self.time_strings.get(key)
+        if text is None:
+            # Old seconds are never looked up again, so start over once the cache grows
+            if len(self.time_strings) >= 32:
+                self.time_strings.clear()
+            text = self.time_strings[key] = time.strftime(fmt, time_obj)
+        return text
+    
+    def render_text(self, font, text, color):
+        """Render text, reusing the (surface, width) pair from earlier frames when possible"""
+        key = (id(font), text, color)
+        rendered = self.text_cache.get(key)
+        if rendered is None:
+            # Time strings keep adding entries, so start over once the cache grows
+            if len(self.text_cache) >= 64:
+                self.text_cache.clear()
+            surface = font.render(text, True, color)
+            rendered = self.text_cache[key] = (surface, surface.get_width())
+        return rendered
+    
     def update(self):
         """Update world clock state"""
-        self.animation_time += 1
-        self.animation_offset = math.sin(self.animation_time * 0.05) * 2
-        
-        # Update text cursor
-        self.text_cursor_timer += 1
-        if self.text_cursor_timer >= 30:
-            self.text_cursor_visible = not self.text_cursor_visible
-            self.text_cursor_timer = 0
+        self.utc_now = time.time()
+        self.utc_second = int(self.utc_now)
     
     def draw(self, screen):
         """Draw world clock interface"""
@@ -219,46 +292,49 @@ class WorldClock:
         """Draw view mode"""
         # Header
         header_text = "World Clock"
-        header_surface = self.os.font_l.render(header_text, True, ACCENT_COLOR)
-        header_x = SCREEN_WIDTH // 2 - header_surface.get_width() // 2
+        header_surface, header_width = self.render_text(self.os.font_l, header_text, ACCENT_COLOR)
+        header_x = SCREEN_WIDTH // 2 - header_width // 2
         screen.blit(header_surface, (header_x, 5))
         
         # Clock display
-        if len(self.world_clocks) == 1:
+        if len(self.clock_names) == 1:
             # Single large clock
-            clock = self.world_clocks[0]
-            time_obj = self.get_time_for_timezone(clock["timezone"])
+            name = self.clock_names[0]
+            timezone = self.clock_timezones[0]
+            color = self.clock_colors[0]
+            time_obj = self.get_time_for_timezone(timezone)
             
             # Analog clock
             clock_x = SCREEN_WIDTH // 2
             clock_y = 80
             clock_radius = 35
             
-            self.draw_analog_clock(screen, clock_x, clock_y, clock_radius, time_obj, clock["color"])
+            self.draw_analog_clock(screen, clock_x, clock_y, clock_radius, time_obj, color)
             
             # City name
-            city_surface = self.os.font_l.render(clock["name"], True, clock["color"])
-            city_x = SCREEN_WIDTH // 2 - city_surface.get_width() // 2
+            city_surface, city_width = self.render_text(self.os.font_l, name, color)
+            city_x = SCREEN_WIDTH // 2 - city_width // 2
             screen.blit(city_surface, (city_x, 125))
             
             # Digital time
-            time_str = time_obj.strftime("%H:%M:%S")
-            time_surface = self.os.font_l.render(time_str, True, TEXT_COLOR)
-            time_x = SCREEN_WIDTH // 2 - time_surface.get_width() // 2
+            time_str = self.format_time(time_obj, timezone, "%H:%M:%S")
+            time_surface, time_width = self.render_text(self.os.font_l, time_str, TEXT_COLOR)
+            time_x = SCREEN_WIDTH // 2 - time_width // 2
             screen.blit(time_surface, (time_x, 145))
             
             # Date
-            date_str = time_obj.strftime("%A, %B %d")
-            date_surface = self.os.font_m.render(date_str, True, HIGHLIGHT_COLOR)
-            date_x = SCREEN_WIDTH // 2 - date_surface.get_width() // 2
+            date_str = self.format_time(time_obj, timezone, "%A, %B %d")
+            date_surface, date_width = self.render_text(self.os.font_m, date_str, HIGHLIGHT_COLOR)
+            date_x = SCREEN_WIDTH // 2 - date_width // 2
             screen.blit(date_surface, (date_x, 165))
         
         else:
             # Multiple clocks in grid
-            clock_width = SCREEN_WIDTH // min(len(self.world_clocks), 3)
+            clock_width = SCREEN_WIDTH // min(len(self.clock_names), 3)
+            clocks = zip(self.clock_names, self.clock_timezones, self.clock_colors)
             
-            for i, clock in enumerate(self.world_clocks):
-                time_obj = self.get_time_for_timezone(clock["timezone"])
+            for i, (name, timezone, color) in enumerate(clocks):
+                time_obj = self.get_time_for_timezone(timezone)
                 
                 # Position
                 x = 10 + i * (clock_width - 10)
@@ -268,34 +344,34 @@ class WorldClock:
                 if i == self.selected_clock:
                     selection_rect = pygame.Rect(x - 5, y - 5, clock_width - 10, 120)
                     pygame.draw.rect(screen, SELECTED_COLOR, selection_rect)
-                    pygame.draw.rect(screen, clock["color"], selection_rect, 2)
+                    pygame.draw.rect(screen, color, selection_rect, 2)
                 
                 # Small analog clock
                 clock_x = x + (clock_width - 20) // 2
                 clock_y = y + 25
                 clock_radius = 20
                 
-                self.draw_analog_clock(screen, clock_x, clock_y, clock_radius, time_obj, clock["color"])
+                self.draw_analog_clock(screen, clock_x, clock_y, clock_radius, time_obj, color)
                 
                 # City name
-                city_text = clock["name"]
+                city_text = name
                 if len(city_text) > 8:
                     city_text = city_text[:8] + "..."
                 
-                city_surface = self.os.font_m.render(city_text, True, clock["color"])
-                city_x = x + (clock_width - 20 - city_surface.get_width()) // 2
+                city_surface, city_width = self.render_text(self.os.font_m, city_text, color)
+                city_x = x + (clock_width - 20 - city_width) // 2
                 screen.blit(city_surface, (city_x, y + 50))
                 
                 # Digital time
-                time_str = time_obj.strftime("%H:%M")
-                time_surface = self.os.font_m.render(time_str, True, TEXT_COLOR)
-                time_x = x + (clock_width - 20 - time_surface.get_width()) // 2
+                time_str = self.format_time(time_obj, timezone, "%H:%M")
+                time_surface, time_width = self.render_text(self.os.font_m, time_str, TEXT_COLOR)
+                time_x = x + (clock_width - 20 - time_width) // 2
                 screen.blit(time_surface, (time_x, y + 70))
                 
                 # Date (abbreviated)
-                date_str = time_obj.strftime("%m/%d")
-                date_surface = self.os.font_s.render(date_str, True, HIGHLIGHT_COLOR)
-                date_x = x + (clock_width - 20 - date_surface.get_width()) // 2
+                date_str = self.format_time(time_obj, timezone, "%m/%d")
+                date_surface, date_width = self.render_text(self.os.font_s, date_str, HIGHLIGHT_COLOR)
+                date_x = x + (clock_width - 20 - date_width) // 2
                 screen.blit(date_surface, (date_x, y + 90))
         
         # Controls
@@ -306,18 +382,18 @@ class WorldClock:
             "R: Reset"
         ]
         
-        if len(self.world_clocks) < self.max_clocks:
-            status_text = f"Cities: {len(self.world_clocks)}/{self.max_clocks}"
+        if len(self.clock_names) < self.max_clocks:
+            status_text = f"Cities: {len(self.clock_names)}/{self.max_clocks}"
         else:
             status_text = "Maximum cities reached"
         
-        status_surface = self.os.font_s.render(status_text, True, WARNING_COLOR)
-        status_x = SCREEN_WIDTH // 2 - status_surface.get_width() // 2
+        status_surface, status_width = self.render_text(self.os.font_s, status_text, WARNING_COLOR)
+        status_x = SCREEN_WIDTH // 2 - status_width // 2
         screen.blit(status_surface, (status_x, 180))
         
         control_y = SCREEN_HEIGHT - 40
         for i, control in enumerate(controls):
-            control_surface = self.os.font_tiny.render(control, True, HIGHLIGHT_COLOR)
+            control_surface, _ = self.render_text(self.os.font_tiny, control, HIGHLIGHT_COLOR)
             control_x = 10 + (i % 2) * 180
             control_y_pos = control_y + (i // 2) * 12
             screen.blit(control_surface, (control_x, control_y_pos))
@@ -326,13 +402,13 @@ class WorldClock:
         """Draw add mode"""
         # Header
         header_text = "Add World Clock"
-        header_surface = self.os.font_l.render(header_text, True, ACCENT_COLOR)
-        header_x = SCREEN_WIDTH // 2 - header_surface.get_width() // 2
+        header_surface, header_width = self.render_text(self.os.font_l, header_text, ACCENT_COLOR)
+        header_x = SCREEN_WIDTH // 2 - header_width // 2
         screen.blit(header_surface, (header_x, 5))
         
         # Search input
         search_label = "Search capital cities:"
-        search_surface = self.os.font_m.render(search_label, True, TEXT_COLOR)
+        search_surface, _ = self.render_text(self.os.font_m, search_label, TEXT_COLOR)
         screen.blit(search_surface, (10, 35))
         
         # Input field
@@ -340,17 +416,18 @@ class WorldClock:
         pygame.draw.rect(screen, BUTTON_COLOR, input_rect)
         pygame.draw.rect(screen, BUTTON_BORDER_COLOR, input_rect, 2)
         
+        # Cursor blinks once per second, derived from the tick count
         input_text = self.input_text
-        if self.text_cursor_visible:
+        if (pygame.time.get_ticks() // 1000) % 2 == 0:
             input_text += "|"
         
-        input_surface = self.os.font_m.render(input_text, True, TEXT_COLOR)
+        input_surface, _ = self.render_text(self.os.font_m, input_text, TEXT_COLOR)
         screen.blit(input_surface, (15, 58))
         
         # Search results
         if self.search_results:
             results_label = "Select a city:"
-            results_surface = self.os.font_m.render(results_label, True, TEXT_COLOR)
+            results_surface, _ = self.render_text(self.os.font_m, results_label, TEXT_COLOR)
             screen.blit(results_surface, (10, 90))
             
             for i, city in enumerate(self.search_results[:6]):  # Show max 6 results
@@ -365,20 +442,20 @@ class WorldClock:
                 city_info = WORLD_CAPITALS.get(city, {})
                 city_text = f"{city}, {city_info.get('country', 'Unknown')}"
                 
-                city_surface = self.os.font_m.render(city_text, True, TEXT_COLOR)
+                city_surface, _ = self.render_text(self.os.font_m, city_text, TEXT_COLOR)
                 screen.blit(city_surface, (15, result_y))
                 
                 # Timezone info
                 timezone = city_info.get('timezone', 0)
                 tz_text = f"UTC{timezone:+.1f}" if timezone != int(timezone) else f"UTC{int(timezone):+d}"
-                tz_surface = self.os.font_s.render(tz_text, True, HIGHLIGHT_COLOR)
-                tz_x = SCREEN_WIDTH - tz_surface.get_width() - 15
+                tz_surface, tz_width = self.render_text(self.os.font_s, tz_text, HIGHLIGHT_COLOR)
+                tz_x = SCREEN_WIDTH - tz_width - 15
                 screen.blit(tz_surface, (tz_x, result_y + 2))
         
         elif self.input_text:
             no_results_text = "No matching cities found"
-            no_results_surface = self.os.font_m.render(no_results_text, True, ERROR_COLOR)
-            no_results_x = SCREEN_WIDTH // 2 - no_results_surface.get_width() // 2
+            no_results_surface, no_results_width = self.render_text(self.os.font_m, no_results_text, ERROR_COLOR)
+            no_results_x = SCREEN_WIDTH // 2 - no_results_width // 2
             screen.blit(no_results_surface, (no_results_x, 100))
         
         # Controls
@@ -391,7 +468,7 @@ class WorldClock:
         
         control_y = SCREEN_HEIGHT - 40
         for i, control in enumerate(controls):
-            control_surface = self.os.font_tiny.render(control, True, HIGHLIGHT_COLOR)
+            control_surface, _ = self.render_text(self.os.font_tiny, control, HIGHLIGHT_COLOR)
             control_x = 10 + (i % 2) * 180
             control_y_pos = control_y + (i // 2) * 12
             screen.blit(control_surface, (control_x, control_y_pos))
@@ -399,10 +476,11 @@ class WorldClock:
     def save_data(self):
         """Save world clock data"""
         return {
-            "world_clocks": self.world_clocks
+            "world_clocks": self.get_clocks()
         }
     
     def load_data(self, data):
         """Load world clock data"""
-        self.world_clocks = data.get("world_clocks", self.world_clocks)
+        if "world_clocks" in data:
+            self.set_clocks(data["world_clocks"])
         self.selected_clock = 0
@@ -4,12 +4,15 @@ Data persistence manager for LightBerry OS
 
 import json
 import os
+import shutil
 from datetime import datetime
 
 class DataManager:
     def __init__(self, data_file="lightberry_data.json"):
         self.data_file = data_file
         self.data = {}
+        self.saved_content = None  # Serialized data (minus timestamp) last written to disk
+        self.dirty = False  # Module data changed since the last write
         self.load_data()
     
     def load_data(self):
@@ -18,11 +21,14 @@ class DataManager:
             if os.path.exists(self.data_file):
                 with open(self.data_file, 'r') as f:
                     self.data = json.load(f)
+                self.saved_content = self.serialize()
             else:
                 self.data = {}
+                self.saved_content = None
         except Exception as e:
             print(f"Error loading data: {e}")
             self.data = {}
+            self.saved_content = None
         
         return self.data
     
@@ -32,25 +38,55 @@ class DataManager:
             if data is not None:
                 self.data = data
             
+            # Skip the write when nothing but the timestamp would change
+            content = self.serialize()
+            if content == self.saved_content:
+                self.dirty = False
+                return True
+            
             # Add timestamp
             self.data['last_saved'] = datetime.now().isoformat()
             
-            with open(self.data_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            # Write to a temporary file, flush it to disk and rename it over the old
+            # one, so a crash or power cut never leaves a truncated data file behind
+            temp_file = self.data_file + ".tmp"
+            try:
+                with open(temp_file, 'w') as f:
+                    json.dump(self.data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_file, self.data_file)
+            except Exception:
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                raise
             
+            self.saved_content = content
+            self.dirty = False
             return True
         except Exception as e:
             print(f"Error saving data: {e}")
             return False
     
+    def serialize(self):
+        """Serialize data without the last_saved timestamp, for change detection"""
+        data = {key: value for key, value in self.data.items() if key != 'last_saved'}
+        return json.dumps(data, indent=2, sort_keys=True)
+    
     def get_module_data(self, module_name):
         """Get data for specific module"""
         return self.data.get(module_name, {})
     
     def set_module_data(self, module_name, data):
-        """Set data for specific module"""
+        """Set data for specific module (written on the next save_data or flush)"""
         self.data[module_name] = data
-        self.save_data()
+        self.dirty = True
+    
+    def flush(self):
+        """Write pending module data to disk, if any"""
+        if not self.dirty:
+            return True
+        return self.save_data()
     
     def clear_data(self):
         """Clear all data"""
@@ -64,8 +100,15 @@ class DataManager:
             backup_file = f"lightberry_backup_{timestamp}.json"
         
         try:
-            with open(backup_file, 'w') as f:
-                json.dump(self.data, f, indent=2)
+            # Make sure the data file is current, then snapshot it without
+            # re-serializing. save_data replaces the file rather than
+            # rewriting it, so a hard link keeps the old contents intact.
+            if not self.save_data():
+                return None
+            try:
+                os.link(self.data_file, backup_file)
+            except OSError:
+                shutil.copy2(self.data_file, backup_file)
             return backup_file
         except Exception as e:
             print(f"Error creating backup: {e}")
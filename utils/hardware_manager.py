@@ -5,9 +5,119 @@ Real hardware control for WiFi, Bluetooth, and system operations
 
 import subprocess
 import os
+import signal
+import select
+import threading
 import re
-import json
-from datetime import datetime
+import time
+
+# wpa_supplicant is started with -P so it can be stopped without killall
+WPA_SUPPLICANT_PID_FILE = '/run/wpa_supplicant/{}.pid'
+
+# Precompiled patterns for parsing command output and /proc files
+ESSID_PATTERN = re.compile(r'ESSID:"([^"]*)"')
+CPU_MODEL_PATTERN = re.compile(r'model name\s*:\s*(.+)')
+MEM_TOTAL_PATTERN = re.compile(r'MemTotal:\s*(\d+)\s*kB')
+OS_NAME_PATTERN = re.compile(r'PRETTY_NAME="([^"]*)"')
+IP_ADDRESS_PATTERN = re.compile(r'inet (\d+\.\d+\.\d+\.\d+)')
+GATEWAY_PATTERN = re.compile(r'default via (\d+\.\d+\.\d+\.\d+)')
+
+# Interactive bluetoothctl output: colour codes and readline markers, device list lines
+BLUETOOTHCTL_NOISE_PATTERN = re.compile(r'\x1b\[[0-9;]*[A-Za-z]|[\x01\x02\r]')
+BLUETOOTH_DEVICE_PATTERN = re.compile(
+    r'^(?:\[[^\]]*\]# ?)?(?:\[NEW\] )?Device ((?:[0-9A-F]{2}:){5}[0-9A-F]{2}) ?(.*)$',
+    re.MULTILINE
+)
+# Every command sent to bluetoothctl is read up to one of these result lines. Commands with
+# no result line of their own are followed by `version`, whose reply marks the end of their output
+BLUETOOTH_VERSION_RESULT = re.compile(r'Version \d+\.\d+')
+BLUETOOTH_CHANGE_RESULT = re.compile(r'Changing \w+ \w+ (succeeded|failed)|Failed|Error|No default controller')
+BLUETOOTH_SCAN_ON_RESULT = re.compile(r'Discovery started|Failed|Error|No default controller')
+BLUETOOTH_SCAN_OFF_RESULT = re.compile(r'Discovery stopped|Failed|Error|No default controller')
+BLUETOOTH_PAIR_RESULT = re.compile(r'Pairing successful|Failed to pair|Error|No default controller')
+BLUETOOTH_TRUST_RESULT = re.compile(r'trust succeeded|Failed|Error|No default controller')
+BLUETOOTH_CONNECT_RESULT = re.compile(r'Connection successful|Failed to connect|Error|No default controller')
+
+# One pass over `iwlist scan` output: each match is a cell start or one field of the current cell
+IWLIST_SCAN_PATTERN = re.compile(
+    r'^\s*(?P<cell>Cell)'
+    r'|ESSID:"(?P<essid>[^"]*)"'
+    r'|Quality=(?P<quality>\d+)/(?P<quality_max>\d+)(?:.*?Signal level=(?P<signal>-?\d+))?'
+    r'|Encryption key:(?P<encryption>\S*)'
+    r'|IE: (?P<security>WPA Version 1|WPA2|WPA3)',
+    re.MULTILINE
+)
+
+def parse_iwlist_scan(output):
+    """Parse `iwlist scan` output into a list of networks, unique by name"""
+    networks = []
+    current_network = {}
+    
+    for match in IWLIST_SCAN_PATTERN.finditer(output):
+        if match.group('cell'):
+            # New cell (network) starts, save previous network
+            if 'name' in current_network:
+                networks.append(current_network)
+            current_network = {}
+        
+        elif match.group('essid') is not None:
+            essid = match.group('essid')
+            if essid and essid != '<hidden>':
+                current_network['name'] = essid
+        
+        elif match.group('quality'):
+            quality_percent = int((int(match.group('quality')) / int(match.group('quality_max'))) * 100)
+            current_network['quality'] = f"{quality_percent}%"
+            if match.group('signal'):
+                current_network['signal_level'] = int(match.group('signal'))
+        
+        elif match.group('encryption') is not None:
+            current_network['encrypted'] = match.group('encryption') == 'on'
+        
+        elif match.group('security'):
+            security = match.group('security')
+            current_network['security'] = 'WPA' if security == 'WPA Version 1' else security
+    
+    # Add last network
+    if 'name' in current_network:
+        networks.append(current_network)
+    
+    # Remove duplicates based on name
+    seen = set()
+    unique_networks = []
+    for network in networks:
+        if network['name'] not in seen:
+            seen.add(network['name'])
+            unique_networks.append(network)
+    
+    return unique_networks
+
+def parse_bluetooth_devices(output, found):
+    """Add the devices listed in bluetoothctl output to found (address -> name)"""
+    for address, name in BLUETOOTH_DEVICE_PATTERN.findall(output):
+        found[address] = name.strip() or found.get(address) or 'Unknown Device'
+    return found
+
+def read_first_match(path, pattern):
+    """Read a file line by line and return the first line matching pattern"""
+    with open(path, 'r') as f:
+        for line in f:
+            match = pattern.match(line)
+            if match:
+                return match
+    return None
+
+def format_size(size):
+    """Format a byte count the way `df -h` does (e.g. 512M, 4.5G, 29G)"""
+    size = float(size)
+    for unit in ('', 'K', 'M', 'G', 'T'):
+        if size < 1024 or unit == 'T':
+            break
+        size /= 1024
+    
+    if unit and size < 10:
+        return f"{size:.1f}{unit}"
+    return f"{size:.0f}{unit}"
 
 class HardwareManager:
     def __init__(self):
@@ -15,87 +125,50 @@ class HardwareManager:
         self.bluetooth_enabled = False
         self.wifi_networks = []
         self.bluetooth_devices = []
+        
+        # WiFi scan result cache: interface -> (timestamp, networks)
+        self.wifi_scan_cache = {}
+        self.wifi_scan_ttl = 15  # seconds
+        self.wifi_scan_lock = threading.Lock()  # held while iwlist is running
+        
+        # Shared interactive bluetoothctl process, started on first use. Settings calls
+        # in from several threads, so each command's write and read hold the lock
+        self.bluetoothctl = None
+        self.bluetoothctl_lock = threading.Lock()
+        
+        # System info cache: static part kept forever, full result for a few seconds
+        self.static_system_info = None
+        self.system_info = None
+        self.system_info_time = 0
+        self.system_info_ttl = 5  # seconds
     
-    def scan_wifi_networks(self):
-        """Scan for available WiFi networks"""
+    def scan_wifi_networks(self, force=False):
+        """Scan for available WiFi networks (recent results are reused unless force is set)"""
+        cached = self.wifi_scan_cache.get(self.wifi_interface)
+        if not force and cached and time.monotonic() - cached[0] < self.wifi_scan_ttl:
+            return cached[1]
+        
+        # A second iwlist while one is running only fails with "Device or resource busy"
+        if not self.wifi_scan_lock.acquire(blocking=False):
+            return self.wifi_networks
+        
         try:
             # Use sudo iwlist to scan for networks (better results)
             result = subprocess.run(['sudo', 'iwlist', self.wifi_interface, 'scan'], 
-                                  capture_output=True, text=True)
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             
             networks = []
             if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                current_network = {}
-                
-                for line in lines:
-                    line = line.strip()
-                    
-                    # New cell (network) starts
-                    if line.startswith('Cell') and current_network:
-                        # Save previous network
-                        if 'name' in current_network:
-                            networks.append(current_network)
-                        current_network = {}
-                    
-                    # Extract network name (ESSID)
-                    if 'ESSID:' in line:
-                        essid_match = re.search(r'ESSID:"([^"]*)"', line)
-                        if essid_match:
-                            essid = essid_match.group(1)
-                            if essid and essid != '<hidden>':
-                                current_network['name'] = essid
-                    
-                    # Extract signal quality
-                    elif 'Quality=' in line:
-                        quality_match = re.search(r'Quality=(\d+)/(\d+)', line)
-                        if quality_match:
-                            quality_num = int(quality_match.group(1))
-                            quality_max = int(quality_match.group(2))
-                            quality_percent = int((quality_num / quality_max) * 100)
-                            current_network['quality'] = f"{quality_percent}%"
-                        
-                        # Also extract signal level
-                        signal_match = re.search(r'Signal level=(-?\d+)', line)
-                        if signal_match:
-                            signal_level = int(signal_match.group(1))
-                            current_network['signal_level'] = signal_level
-                    
-                    # Extract encryption status
-                    elif 'Encryption key:' in line:
-                        encrypted = 'on' in line
-                        current_network['encrypted'] = encrypted
-                    
-                    # Extract security type
-                    elif 'IE: WPA Version 1' in line:
-                        current_network['security'] = 'WPA'
-                    elif 'IE: WPA2' in line:
-                        current_network['security'] = 'WPA2'
-                    elif 'IE: WPA3' in line:
-                        current_network['security'] = 'WPA3'
-                
-                # Add last network
-                if current_network and 'name' in current_network:
-                    networks.append(current_network)
-                
-                # Remove duplicates based on name
-                seen = set()
-                unique_networks = []
-                for network in networks:
-                    if network['name'] not in seen:
-                        seen.add(network['name'])
-                        unique_networks.append(network)
-                
-                networks = unique_networks
+                networks = parse_iwlist_scan(result.stdout)
             
             else:
                 # Fallback to regular iwlist (without sudo)
                 result = subprocess.run(['iwlist', self.wifi_interface, 'scan'], 
-                                      capture_output=True, text=True)
+                                      stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
                 
                 if result.returncode == 0:
                     # Simple extraction for fallback
-                    essid_matches = re.findall(r'ESSID:"([^"]*)"', result.stdout)
+                    essid_matches = ESSID_PATTERN.findall(result.stdout)
                     networks = []
                     for essid in essid_matches:
                         if essid and essid != '<hidden>':
@@ -107,18 +180,22 @@ class HardwareManager:
                             })
             
             self.wifi_networks = networks
+            if networks:
+                self.wifi_scan_cache[self.wifi_interface] = (time.monotonic(), networks)
             return networks
             
         except Exception as e:
             print(f"Error scanning WiFi: {e}")
             return []
+        
+        finally:
+            self.wifi_scan_lock.release()
     
     def connect_wifi(self, ssid, password, security='WPA2'):
         """Connect to WiFi network"""
         try:
-            # Kill existing wpa_supplicant processes
-            subprocess.run(['sudo', 'killall', 'wpa_supplicant'], 
-                         capture_output=True, text=True)
+            # Stop existing wpa_supplicant process
+            self.stop_wpa_supplicant()
             
             # Create wpa_supplicant configuration
             config_content = f"""
@@ -133,28 +210,21 @@ network={{
 }}
 """
             
-            # Write configuration to proper location
+            # Write configuration straight to its location with sudo
             config_path = '/etc/wpa_supplicant/wpa_supplicant.conf'
-            with open('/tmp/wpa_temp.conf', 'w') as f:
-                f.write(config_content)
-            
-            # Copy to proper location with sudo
-            subprocess.run(['sudo', 'cp', '/tmp/wpa_temp.conf', config_path], 
-                         capture_output=True, text=True)
+            subprocess.run(['sudo', 'tee', config_path], input=config_content,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, text=True)
             
             # Restart wpa_supplicant
             result = subprocess.run([
                 'sudo', 'wpa_supplicant', '-B', '-i', self.wifi_interface,
-                '-c', config_path
-            ], capture_output=True, text=True)
+                '-c', config_path, '-P', WPA_SUPPLICANT_PID_FILE.format(self.wifi_interface)
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             if result.returncode == 0:
                 # Get IP address
                 dhcp_result = subprocess.run(['sudo', 'dhclient', self.wifi_interface], 
-                                           capture_output=True, text=True)
-                
-                # Clean up temporary file
-                os.remove('/tmp/wpa_temp.conf')
+                                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 
                 return dhcp_result.returncode == 0
             
@@ -164,13 +234,42 @@ network={{
             print(f"Error connecting to WiFi: {e}")
             return False
     
+    def stop_wpa_supplicant(self):
+        """Stop the wpa_supplicant running on our interface via its PID file"""
+        try:
+            with open(WPA_SUPPLICANT_PID_FILE.format(self.wifi_interface), 'r') as f:
+                pid = int(f.read().strip())
+            
+            # A stale PID file (crash, SIGKILL) can name a PID since reused by another process
+            with open(f'/proc/{pid}/comm', 'r') as f:
+                if f.read().strip() != 'wpa_supplicant':
+                    pid = None
+        except (OSError, ValueError):
+            pid = None
+        
+        if pid is not None:
+            try:
+                os.kill(pid, signal.SIGTERM)
+                return
+            except PermissionError:
+                # wpa_supplicant runs as root
+                result = subprocess.run(['sudo', 'kill', '-TERM', str(pid)], 
+                                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                if result.returncode == 0:
+                    return
+            except ProcessLookupError:
+                pass
+        
+        # No live wpa_supplicant behind the PID file (e.g. started by the system), fall back to killall
+        subprocess.run(['sudo', 'killall', 'wpa_supplicant'], 
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    
     def disconnect_wifi(self):
         """Disconnect from WiFi"""
         try:
-            subprocess.run(['sudo', 'killall', 'wpa_supplicant'], 
-                         capture_output=True, text=True)
+            self.stop_wpa_supplicant()
             subprocess.run(['sudo', 'ip', 'addr', 'flush', 'dev', self.wifi_interface], 
-                         capture_output=True, text=True)
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             return True
         except Exception as e:
             print(f"Error disconnecting WiFi: {e}")
@@ -180,12 +279,12 @@ network={{
         """Get current WiFi status"""
         try:
             result = subprocess.run(['iwconfig', self.wifi_interface], 
-                                  capture_output=True, text=True)
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             
             if result.returncode == 0:
                 output = result.stdout
                 if 'ESSID:' in output:
-                    essid_match = re.search(r'ESSID:"([^"]*)"', output)
+                    essid_match = ESSID_PATTERN.search(output)
                     if essid_match and essid_match.group(1):
                         return {
                             'connected': True,
@@ -199,12 +298,73 @@ network={{
             print(f"Error getting WiFi status: {e}")
             return {'connected': False}
     
+    def get_bluetoothctl(self):
+        """Return the shared bluetoothctl process, starting it if needed (call with bluetoothctl_lock held)"""
+        if self.bluetoothctl is None or self.bluetoothctl.poll() is not None:
+            self.bluetoothctl = subprocess.Popen(['sudo', 'bluetoothctl'], stdin=subprocess.PIPE,
+                                                 stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
+            # Skip the startup banner
+            self.bluetoothctl.stdin.write(b"version\n")
+            self.read_bluetoothctl(2, BLUETOOTH_VERSION_RESULT)
+        return self.bluetoothctl
+    
+    def read_bluetoothctl(self, timeout, until):
+        """Read bluetoothctl output until `until` matches or timeout passes"""
+        fd = self.bluetoothctl.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        data = b''
+        output = ''
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                break
+            
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                break
+            data += chunk
+            output = BLUETOOTHCTL_NOISE_PATTERN.sub('', data.decode('utf-8', 'replace'))
+            if until.search(output):
+                break
+        
+        return output
+    
+    def discard_bluetoothctl_output(self):
+        """Drop output left over from earlier commands (late results, discovery events)"""
+        fd = self.bluetoothctl.stdout.fileno()
+        while select.select([fd], [], [], 0)[0]:
+            if not os.read(fd, 4096):
+                break
+    
+    def bluetooth_command(self, command, until, timeout=2):
+        """Send one command to the shared bluetoothctl process and return its output up to `until`"""
+        with self.bluetoothctl_lock:
+            process = self.get_bluetoothctl()
+            self.discard_bluetoothctl_output()
+            process.stdin.write(f"{command}\n".encode())
+            return self.read_bluetoothctl(timeout, until)
+    
+    def close(self):
+        """Stop the shared bluetoothctl process"""
+        with self.bluetoothctl_lock:
+            if self.bluetoothctl is not None and self.bluetoothctl.poll() is None:
+                try:
+                    self.bluetoothctl.stdin.write(b"quit\n")
+                    self.bluetoothctl.wait(timeout=1)
+                except (OSError, subprocess.TimeoutExpired):
+                    self.bluetoothctl.kill()
+            self.bluetoothctl = None
+    
     def enable_bluetooth(self):
         """Enable Bluetooth"""
         try:
-            result = subprocess.run(['sudo', 'bluetoothctl', 'power', 'on'], 
-                                  capture_output=True, text=True)
-            self.bluetooth_enabled = result.returncode == 0
+            output = self.bluetooth_command('power on', until=BLUETOOTH_CHANGE_RESULT)
+            self.bluetooth_enabled = 'succeeded' in output
             return self.bluetooth_enabled
         except Exception as e:
             print(f"Error enabling Bluetooth: {e}")
@@ -213,9 +373,8 @@ network={{
     def disable_bluetooth(self):
         """Disable Bluetooth"""
         try:
-            result = subprocess.run(['sudo', 'bluetoothctl', 'power', 'off'], 
-                                  capture_output=True, text=True)
-            self.bluetooth_enabled = result.returncode != 0
+            output = self.bluetooth_command('power off', until=BLUETOOTH_CHANGE_RESULT)
+            self.bluetooth_enabled = 'succeeded' not in output
             return not self.bluetooth_enabled
         except Exception as e:
             print(f"Error disabling Bluetooth: {e}")
@@ -225,42 +384,36 @@ network={{
         """Scan for Bluetooth devices"""
         try:
             # Clear previous devices
-            subprocess.run(['sudo', 'bluetoothctl', 'remove', '*'], 
-                         capture_output=True, text=True)
+            self.bluetooth_command('remove *\nversion', until=BLUETOOTH_VERSION_RESULT)
             
             # Start discoverable and pairable
-            subprocess.run(['sudo', 'bluetoothctl', 'discoverable', 'on'], 
-                         capture_output=True, text=True)
-            subprocess.run(['sudo', 'bluetoothctl', 'pairable', 'on'], 
-                         capture_output=True, text=True)
-            
-            # Start scan
-            subprocess.run(['sudo', 'bluetoothctl', 'scan', 'on'], 
-                         capture_output=True, text=True)
-            
-            # Wait for devices to be discovered
-            import time
-            time.sleep(5)
-            
-            # Get devices
-            result = subprocess.run(['sudo', 'bluetoothctl', 'devices'], 
-                                  capture_output=True, text=True)
-            
-            devices = []
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if line.startswith('Device'):
-                        parts = line.split(' ', 2)
-                        if len(parts) >= 3:
-                            devices.append({
-                                'address': parts[1],
-                                'name': parts[2] if parts[2] else 'Unknown Device'
-                            })
+            self.bluetooth_command('discoverable on', until=BLUETOOTH_CHANGE_RESULT)
+            self.bluetooth_command('pairable on', until=BLUETOOTH_CHANGE_RESULT)
+            
+            # Start scan; devices reported with the scan start count towards the first poll
+            found = {}
+            parse_bluetooth_devices(self.bluetooth_command('scan on', until=BLUETOOTH_SCAN_ON_RESULT), found)
+            
+            # Poll the device list until it stops growing for two polls (at most 5 seconds)
+            stalls = 0
+            poll_timeout = 0.3  # upper bound; the version reply normally ends each poll sooner
+            deadline = time.monotonic() + 5
+            while True:
+                remaining = deadline - time.monotonic() - poll_timeout
+                if remaining <= 0:
+                    break
+                time.sleep(min(0.5, remaining))
+                count = len(found)
+                parse_bluetooth_devices(self.bluetooth_command('devices\nversion', until=BLUETOOTH_VERSION_RESULT,
+                                                                 timeout=poll_timeout), found)
+                stalls = stalls + 1 if len(found) == count else 0
+                if found and stalls >= 2:
+                    break
+            
+            devices = [{'address': address, 'name': name} for address, name in found.items()]
             
             # Stop scan
-            subprocess.run(['sudo', 'bluetoothctl', 'scan', 'off'], 
-                         capture_output=True, text=True)
+            self.bluetooth_command('scan off', until=BLUETOOTH_SCAN_OFF_RESULT)
             
             self.bluetooth_devices = devices
             return devices
@@ -273,19 +426,17 @@ network={{
         """Connect to Bluetooth device"""
         try:
             # Pair first
-            pair_result = subprocess.run(['sudo', 'bluetoothctl', 'pair', address], 
-                                       capture_output=True, text=True)
+            pair_output = self.bluetooth_command(f'pair {address}', timeout=20, until=BLUETOOTH_PAIR_RESULT)
             
-            if pair_result.returncode == 0:
+            if 'Pairing successful' in pair_output:
                 # Trust device
-                subprocess.run(['sudo', 'bluetoothctl', 'trust', address], 
-                             capture_output=True, text=True)
+                self.bluetooth_command(f'trust {address}', until=BLUETOOTH_TRUST_RESULT)
                 
                 # Connect
-                connect_result = subprocess.run(['sudo', 'bluetoothctl', 'connect', address], 
-                                              capture_output=True, text=True)
+                connect_output = self.bluetooth_command(f'connect {address}', timeout=15,
+                                                        until=BLUETOOTH_CONNECT_RESULT)
                 
-                return connect_result.returncode == 0
+                return 'Connection successful' in connect_output
             
             return False
             
@@ -294,64 +445,69 @@ network={{
             return False
     
     def get_system_info(self):
-        """Get system information"""
+        """Get system information (cached for system_info_ttl seconds)"""
+        now = time.monotonic()
+        if self.system_info is not None and now - self.system_info_time < self.system_info_ttl:
+            return self.system_info
+        
         try:
-            info = {}
+            # CPU, memory and OS never change while we are running
+            if self.static_system_info is None:
+                self.static_system_info = self.get_static_system_info()
             
-            # CPU info
-            with open('/proc/cpuinfo', 'r') as f:
-                cpu_info = f.read()
-                model_match = re.search(r'model name\s*:\s*(.+)', cpu_info)
-                if model_match:
-                    info['cpu'] = model_match.group(1).strip()
-            
-            # Memory info
-            with open('/proc/meminfo', 'r') as f:
-                mem_info = f.read()
-                total_match = re.search(r'MemTotal:\s*(\d+)\s*kB', mem_info)
-                if total_match:
-                    total_mb = int(total_match.group(1)) // 1024
-                    info['memory'] = f"{total_mb} MB"
+            info = dict(self.static_system_info)
             
             # Storage info
-            result = subprocess.run(['df', '-h', '/'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                if len(lines) > 1:
-                    parts = lines[1].split()
-                    if len(parts) >= 4:
-                        info['storage_total'] = parts[1]
-                        info['storage_used'] = parts[2]
-                        info['storage_free'] = parts[3]
-            
-            # OS info
-            try:
-                with open('/etc/os-release', 'r') as f:
-                    os_info = f.read()
-                    name_match = re.search(r'PRETTY_NAME="([^"]*)"', os_info)
-                    if name_match:
-                        info['os'] = name_match.group(1)
-            except:
-                info['os'] = 'Linux'
+            stat = os.statvfs('/')
+            info['storage_total'] = format_size(stat.f_blocks * stat.f_frsize)
+            info['storage_used'] = format_size((stat.f_blocks - stat.f_bfree) * stat.f_frsize)
+            info['storage_free'] = format_size(stat.f_bavail * stat.f_frsize)
             
             # Uptime
-            with open('/proc/uptime', 'r') as f:
-                uptime_seconds = float(f.read().split()[0])
-                uptime_hours = int(uptime_seconds // 3600)
-                uptime_minutes = int((uptime_seconds % 3600) // 60)
-                info['uptime'] = f"{uptime_hours}h {uptime_minutes}m"
+            with open('/proc/uptime', 'rb') as f:
+                buf = f.read(64)
+            uptime_seconds = int(float(buf[:buf.index(b' ')]))
+            info['uptime'] = f"{uptime_seconds // 3600}h {(uptime_seconds % 3600) // 60}m"
             
+            self.system_info = info
+            self.system_info_time = now
             return info
             
         except Exception as e:
             print(f"Error getting system info: {e}")
             return {}
     
+    def get_static_system_info(self):
+        """Read system information that does not change at runtime"""
+        info = {}
+        
+        # CPU info
+        model_match = read_first_match('/proc/cpuinfo', CPU_MODEL_PATTERN)
+        if model_match:
+            info['cpu'] = model_match.group(1).strip()
+        
+        # Memory info
+        total_match = read_first_match('/proc/meminfo', MEM_TOTAL_PATTERN)
+        if total_match:
+            total_mb = int(total_match.group(1)) // 1024
+            info['memory'] = f"{total_mb} MB"
+        
+        # OS info
+        try:
+            name_match = read_first_match('/etc/os-release', OS_NAME_PATTERN)
+            if name_match:
+                info['os'] = name_match.group(1)
+        except:
+            info['os'] = 'Linux'
+        
+        return info
+    
     def restart_system(self):
         """Restart the system"""
         try:
-            subprocess.run(['sudo', 'reboot'], capture_output=True, text=True)
+            # Don't wait on the child; the system is going down anyway
+            subprocess.Popen(['sudo', 'reboot'], stdin=subprocess.DEVNULL,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
             return True
         except Exception as e:
             print(f"Error restarting system: {e}")
@@ -360,8 +516,8 @@ network={{
     def shutdown_system(self):
         """Shutdown the system"""
         try:
-            subprocess.run(['sudo', 'shutdown', '-h', 'now'], 
-                         capture_output=True, text=True)
+            subprocess.Popen(['sudo', 'shutdown', '-h', 'now'], stdin=subprocess.DEVNULL,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
             return True
         except Exception as e:
             print(f"Error shutting down system: {e}")
@@ -372,21 +528,23 @@ network={{
         try:
             info = {}
             
-            # Get IP address
-            result = subprocess.run(['ip', 'addr', 'show', self.wifi_interface], 
-                                  capture_output=True, text=True)
+            # Start both ip queries at once; they do not depend on each other
+            addr_proc = subprocess.Popen(['ip', 'addr', 'show', self.wifi_interface],
+                                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            route_proc = subprocess.Popen(['ip', 'route', 'show', 'default'],
+                                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             
-            if result.returncode == 0:
-                ip_match = re.search(r'inet (\d+\.\d+\.\d+\.\d+)', result.stdout)
+            # Get IP address
+            addr_output, _ = addr_proc.communicate()
+            if addr_proc.returncode == 0:
+                ip_match = IP_ADDRESS_PATTERN.search(addr_output)
                 if ip_match:
                     info['ip'] = ip_match.group(1)
             
             # Get gateway
-            result = subprocess.run(['ip', 'route', 'show', 'default'], 
-                                  capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                gateway_match = re.search(r'default via (\d+\.\d+\.\d+\.\d+)', result.stdout)
+            route_output, _ = route_proc.communicate()
+            if route_proc.returncode == 0:
+                gateway_match = GATEWAY_PATTERN.search(route_output)
                 if gateway_match:
                     info['gateway'] = gateway_match.group(1)
             
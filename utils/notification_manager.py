@@ -4,79 +4,120 @@ Notification system for LightBerry OS
 
 import pygame
 import time
+from collections import deque
 from datetime import datetime, timedelta
 from config.constants import *
 
 class Notification:
+    __slots__ = (
+        'title', 'message', 'duration', 'type', 'created_time', 'fade_start', 'expire_time', 'alpha', 'y_offset',
+        'text_font', 'surface', 'drawn_alpha', 'color'
+    )
+    
+    # Colors based on type
+    colors = {
+        "info": NOTIFICATION_COLOR,
+        "success": SUCCESS_COLOR,
+        "warning": WARNING_COLOR,
+        "error": ERROR_COLOR,
+        "event": CALENDAR_EVENT_COLOR
+    }
+    
+    # Background and border surfaces, one per color, shared by all notifications
+    background_templates = {}
+    
     def __init__(self, title, message, duration=5, notification_type="info"):
         self.title = title
         self.message = message
         self.duration = duration
         self.type = notification_type
         self.created_time = time.time()
+        self.fade_start = self.created_time + duration - 1  # fade out over the last second
+        self.expire_time = self.created_time + duration
         self.alpha = 255
         self.y_offset = 0
         
-        # Colors based on type
-        self.colors = {
-            "info": NOTIFICATION_COLOR,
-            "success": SUCCESS_COLOR,
-            "warning": WARNING_COLOR,
-            "error": ERROR_COLOR,
-            "event": CALENDAR_EVENT_COLOR
-        }
+        # Background, title and message composed into one surface, once per font
+        self.text_font = None
+        self.surface = None
+        self.drawn_alpha = None  # alpha last applied to the surface
         
-        self.color = self.colors.get(notification_type, NOTIFICATION_COLOR)
+        self.color = Notification.colors.get(notification_type, NOTIFICATION_COLOR)
     
-    def is_expired(self):
-        return time.time() - self.created_time > self.duration
+    def is_expired(self, now):
+        return now >= self.expire_time
     
-    def update(self):
+    def update(self, now):
         # Fade out animation
-        elapsed = time.time() - self.created_time
-        if elapsed > self.duration - 1:
-            self.alpha = max(0, 255 - int((elapsed - (self.duration - 1)) * 255))
+        fading = now - self.fade_start
+        if fading > 0:
+            # 16 alpha levels look the same as 256 and change the surfaces far less often
+            alpha = 255 - int(fading * 255)
+            self.alpha = alpha & 0xF0 if alpha > 0 else 0
     
-    def draw(self, screen, font, y_position):
-        if self.alpha <= 0:
-            return
-        
-        # Create notification surface
-        notification_height = 50
-        notification_width = SCREEN_WIDTH - 20
+    def get_background(self):
+        """Get the shared background template for this notification's color"""
+        background = Notification.background_templates.get(self.color)
+        if background is None:
+            notification_height = 50
+            notification_width = SCREEN_WIDTH - 20
+            
+            # Drawn at full strength; the fade is applied with set_alpha when blitting
+            background = pygame.Surface((notification_width, notification_height), pygame.SRCALPHA)
+            pygame.draw.rect(background, (*self.color, 200), (0, 0, notification_width, notification_height))
+            pygame.draw.rect(background, (*TEXT_COLOR, 255), 
+                            (0, 0, notification_width, notification_height), 2)
+            Notification.background_templates[self.color] = background
         
-        # Background with alpha
-        surf = pygame.Surface((notification_width, notification_height), pygame.SRCALPHA)
-        bg_color = (*self.color, min(200, self.alpha))
-        pygame.draw.rect(surf, bg_color, (0, 0, notification_width, notification_height))
-        pygame.draw.rect(surf, (*TEXT_COLOR, self.alpha), 
-                        (0, 0, notification_width, notification_height), 2)
+        return background
+    
+    def render(self, font):
+        """Compose background, title and message into this notification's own surface"""
+        # Own copy of the template, so notifications fading at different rates can be batched
+        surface = self.get_background().copy()
         
         # Title
-        title_color = (*TEXT_COLOR, self.alpha)
-        title_surface = font.render(self.title, True, title_color)
-        surf.blit(title_surface, (10, 5))
+        surface.blit(font.render(self.title, True, TEXT_COLOR), (10, 5))
         
         # Message
-        message_surface = font.render(self.message, True, title_color)
-        surf.blit(message_surface, (10, 25))
+        surface.blit(font.render(self.message, True, TEXT_COLOR), (10, 25))
+        
+        # Match the display's pixel format for the fastest blit (needs set_mode to have run)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        
+        return surface
+    
+    def get_blits(self, font, position):
+        """Get the (surface, position) pairs that draw this notification"""
+        if self.alpha <= 0:
+            return []
+        
+        if self.text_font is not font:
+            self.text_font = font
+            self.surface = self.render(font)
+            self.drawn_alpha = None
         
-        # Draw to screen
-        screen.blit(surf, (10, y_position))
+        if self.alpha != self.drawn_alpha:
+            self.surface.set_alpha(self.alpha)
+            self.drawn_alpha = self.alpha
+        
+        return [(self.surface, position)]
 
 class NotificationManager:
     def __init__(self):
-        self.notifications = []
         self.max_notifications = 3
+        
+        # Screen position of each notification slot
+        self.slot_positions = [(10, 10 + i * 55) for i in range(self.max_notifications)]
+        
+        # Oldest first; appending past maxlen drops the oldest
+        self.notifications = deque(maxlen=self.max_notifications)
     
     def add_notification(self, title, message, duration=5, notification_type="info"):
         """Add a new notification"""
         notification = Notification(title, message, duration, notification_type)
         self.notifications.append(notification)
-        
-        # Remove oldest if too many
-        if len(self.notifications) > self.max_notifications:
-            self.notifications.pop(0)
     
     def add_event_notification(self, event_title, event_time):
         """Add a calendar event notification"""
@@ -89,24 +130,44 @@ class NotificationManager:
     
     def update(self):
         """Update all notifications"""
+        if not self.notifications:
+            return
+        
+        # One clock read per frame for every notification
+        now = time.time()
+        
         # Update existing notifications
         for notification in self.notifications:
-            notification.update()
+            notification.update(now)
+        
+        # Remove expired notifications, which are normally the oldest ones
+        while self.notifications and self.notifications[0].is_expired(now):
+            self.notifications.popleft()
         
-        # Remove expired notifications
-        self.notifications = [n for n in self.notifications if not n.is_expired()]
+        # A short notification can still expire behind a longer one
+        if any(n.is_expired(now) for n in self.notifications):
+            self.notifications = deque((n for n in self.notifications if not n.is_expired(now)),
+                                       maxlen=self.max_notifications)
     
     def draw(self, screen, font):
         """Draw all notifications"""
-        y_position = 10
-        for notification in self.notifications:
-            notification.draw(screen, font, y_position)
-            y_position += 55
+        if not self.notifications:
+            return
+        
+        blits = []
+        for notification, position in zip(self.notifications, self.slot_positions):
+            blits.extend(notification.get_blits(font, position))
+        
+        # One batched call for every notification (fblits is pygame-ce only)
+        if hasattr(screen, 'fblits'):
+            screen.fblits(blits)
+        else:
+            screen.blits(blits, False)
     
     def clear_all(self):
         """Clear all notifications"""
-        self.notifications = []
+        self.notifications.clear()
     
     def has_notifications(self):
         """Check if there are active notifications"""
-        return len(self.notifications) > 0
+        return bool(self.notifications)